@@ -12,7 +12,6 @@ from core import checks
 from core.models import getLogger, PermissionLevel
 
 from .core.models import AnnouncementModel
-from .core.views import AnnouncementView
 
 
 if TYPE_CHECKING:
@@ -30,6 +29,16 @@ __description__ = "\n".join(__plugin_info__["description"]).format(__version__)
 logger = getLogger(__name__)
 
 
+_news_channel = discord.ChannelType.news
+
+_panel_description = (
+    "Choose a type of announcement using the dropdown menu below.\n\n"
+    "__**Available types:**__\n"
+    "- **Normal** : Plain text announcement.\n"
+    "- **Embed** : Embedded announcement. Image and thumbnail image are also supported."
+)
+
+
 class Announcement(commands.Cog):
     __doc__ = __description__
 
@@ -57,6 +66,9 @@ class Announcement(commands.Cog):
         __**Note:**__
         - If `channel` is not specified, to ensure cleaner output the creation message will automatically be deleted after the announcement is posted.
         """
+        # deferred import, the UI components are only needed once the panel is initiated
+        from .core.views import AnnouncementView
+
         delete = False
         if channel is None:
             channel = ctx.channel
@@ -68,12 +80,10 @@ class Announcement(commands.Cog):
 
         announcement = AnnouncementModel(ctx, channel)
         view = AnnouncementView(ctx, announcement)
-        embed = discord.Embed(title="Announcement Creation Panel", color=self.bot.main_color)
-        embed.description = (
-            "Choose a type of announcement using the dropdown menu below.\n\n"
-            "__**Available types:**__\n"
-            "- **Normal** : Plain text announcement.\n"
-            "- **Embed** : Embedded announcement. Image and thumbnail image are also supported."
+        embed = discord.Embed(
+            title="Announcement Creation Panel",
+            description=_panel_description,
+            color=self.bot.main_color,
         )
         view.message = message = await ctx.send(embed=embed, view=view)
         await view.wait(input_event=True)
@@ -88,7 +98,7 @@ class Announcement(commands.Cog):
 
         embed = message.embeds[0]
         description = f"Announcement has been posted in {channel.mention}.\n\n"
-        if announcement.channel.type == discord.ChannelType.news:
+        if announcement.channel.type is _news_channel:
             description += "Would you like to publish this announcement?\n\n"
             view.generate_buttons(confirmation=True)
         else:
@@ -100,20 +110,20 @@ class Announcement(commands.Cog):
             return
 
         await view.wait()
+        if view.confirm is None:
+            # timed out, the message has already been updated in `view.on_timeout`
+            return
 
         hyper_link = f"[announcement]({announcement.message.jump_url})"
         if view.confirm:
             await announcement.publish()
             embed.description = f"Successfully published this {hyper_link} to all subscribed channels.\n\n"
-        if view.confirm is not None:
-            if not view.confirm:
-                embed.description = (
-                    f"To manually publish this {hyper_link}, use command:\n"
-                    f"```\n{ctx.prefix}publish {announcement.channel.id}-{announcement.message.id}\n```"
-                )
-            view = None
-
-        await message.edit(embed=embed, view=view)
+        else:
+            embed.description = (
+                f"To manually publish this {hyper_link}, use command:\n"
+                f"```\n{ctx.prefix}publish {announcement.channel.id}-{announcement.message.id}\n```"
+            )
+        await message.edit(embed=embed, view=None)
 
     @announce.command(name="quick")
     @checks.has_permissions(PermissionLevel.ADMINISTRATOR)
@@ -138,7 +148,7 @@ class Announcement(commands.Cog):
         - Only messages in [announcement](https://support.discord.com/hc/en-us/articles/360032008192-Announcement-Channels) channels can be published.
         """
         channel = message.channel
-        if not channel.type == discord.ChannelType.news:
+        if channel.type is not _news_channel:
             raise commands.BadArgument(f"Channel {channel.mention} is not an announcement channel.")
         if message.flags.crossposted:
             raise commands.BadArgument(f"Message `{message.id}` is already published.")
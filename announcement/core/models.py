@@ -1,14 +1,23 @@
 import asyncio
+import re
 
 from enum import Enum
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union
 
 import discord
-from discord.utils import MISSING
+from discord.utils import MISSING, utcnow
 from discord.ext import commands
 
 
-def _color_converter(value: str) -> int:
+_id_or_mention_regex = re.compile(r"<@[!&]?([0-9]{15,20})>$|([0-9]{15,20})$")
+
+_role_converter = commands.RoleConverter()
+_member_converter = commands.MemberConverter()
+
+
+@lru_cache(maxsize=128)
+def _parse_color(value: str) -> int:
     try:
         return int(value)
     except (TypeError, ValueError):
@@ -19,6 +28,12 @@ def _color_converter(value: str) -> int:
         raise ValueError(f"`{value}` is unknown color format.")
 
 
+def _color_converter(value: Union[int, str]) -> int:
+    if isinstance(value, int):
+        return value
+    return _parse_color(value)
+
+
 class AnnouncementType(Enum):
 
     # only two are valid for now. may add more later.
@@ -34,70 +49,140 @@ class AnnouncementType(Enum):
         If the value does not match the value of any enum member, AnnouncementType.INVALID
         will be returned.
         """
-        try:
-            return cls(value)
-        except ValueError:
-            return cls.INVALID
-
-    @property
-    def value(self) -> str:
-        """The value of the Enum member."""
-        return self._value_
+        return cls._value2member_map_.get(value, cls.INVALID)
 
 
 class AnnouncementModel:
+
+    __slots__ = (
+        "ctx",
+        "channel",
+        "ready",
+        "type",
+        "message",
+        "_future",
+        "_content",
+        "_embed",
+        "_send_params",
+        "_author_name",
+        "_author_icon",
+        "_guild_icon",
+    )
+
     def __init__(self, ctx: commands.Context, channel: discord.TextChannel):
         self.ctx: commands.Context = ctx
         self.channel: discord.TextChannel = channel
-        self.event: asyncio.Event = asyncio.Event()
         self.ready: bool = False
 
         self.type: AnnouncementType = MISSING
         self.message: discord.Message = MISSING
-        self.content: str = MISSING
-        self.embed: discord.Embed = MISSING
-        self.task: asyncio.Task = MISSING
+
+        self._future: Optional[asyncio.Future] = None
+
+        self._content: str = MISSING
+        self._embed: discord.Embed = MISSING
+        self._send_params: Optional[Dict[str, Any]] = None
+        # these are constant for the session, resolve them once for `create_embed`
+        self._author_name: str = str(ctx.author)
+        self._author_icon: discord.Asset = ctx.author.display_avatar
+        self._guild_icon: Optional[discord.Asset] = channel.guild.icon
+
+    @property
+    def content(self) -> str:
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+        self._send_params = None
+
+    @property
+    def embed(self) -> discord.Embed:
+        return self._embed
+
+    @embed.setter
+    def embed(self, value: discord.Embed) -> None:
+        self._embed = value
+        self._send_params = None
+
+    def _get_future(self) -> asyncio.Future:
+        # created lazily, so the instance does not need a running loop until it is actually used
+        if self._future is None:
+            self._future = self.ctx.bot.loop.create_future()
+        return self._future
 
     @property
     def posted(self) -> bool:
-        return self.event.is_set()
+        future = self._future
+        return future is not None and future.done() and not future.cancelled()
 
     @posted.setter
     def posted(self, flag: bool) -> None:
+        future = self._get_future()
+        if future.done():
+            return
         if flag:
-            self.event.set()
+            future.set_result(None)
         else:
-            if self.task is not MISSING:
-                self.task.cancel()
-            self.event.clear()
+            future.cancel()
+
+    async def wait(self, *, timeout: Optional[float] = None) -> None:
+        """
+        Waits until the announcement is posted or cancelled.
 
-    async def wait(self) -> None:
-        self.task = self.ctx.bot.loop.create_task(self.event.wait())
+        If `timeout` is provided and the time limit is reached, the announcement will be cancelled.
+        """
         try:
-            await self.task
-        except asyncio.CancelledError:
+            await asyncio.wait_for(self._get_future(), timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
             pass
 
+    async def _convert_mention(self, argument: str) -> Union[discord.Role, discord.Member]:
+        try:
+            return await _role_converter.convert(self.ctx, argument)
+        except commands.BadArgument:
+            return await _member_converter.convert(self.ctx, argument)
+
     async def resolve_mentions(self) -> None:
         if not self.content:
             return
-        ret = []
-        argument = self.content.split()
-        for arg in argument:
-            if arg in ("@here", "@everyone"):
-                ret.append(arg)
+        # remove duplicates while preserving the order, the values will be the resolved mentions
+        mentions: Dict[str, Optional[str]] = dict.fromkeys(self.content.split())
+        if "@everyone" in mentions:
+            # this already covers everything else
+            self.content = "@everyone"
+            return
+        guild = self.ctx.guild
+        unresolved = []
+        for arg in mentions:
+            if arg == "@here":
+                mentions[arg] = arg
                 continue
-            user_or_role = None
-            try:
-                user_or_role = await commands.RoleConverter().convert(self.ctx, arg)
-            except commands.BadArgument:
-                try:
-                    user_or_role = await commands.MemberConverter().convert(self.ctx, arg)
-                except commands.BadArgument:
-                    raise commands.BadArgument(f"Unable to convert {arg} to user or role mention.")
-            if user_or_role is not None:
-                ret.append(user_or_role.mention)
-        self.content = ", ".join(ret) if ret else None
+            match = _id_or_mention_regex.match(arg)
+            if match is not None:
+                entity_id = int(match.group(1) or match.group(2))
+                user_or_role = guild.get_role(entity_id) or guild.get_member(entity_id)
+                if user_or_role is not None:
+                    mentions[arg] = user_or_role.mention
+                    continue
+            unresolved.append(arg)
+
+        if unresolved:
+            results = await asyncio.gather(
+                *(self._convert_mention(arg) for arg in unresolved), return_exceptions=True
+            )
+            failed = []
+            for arg, result in zip(unresolved, results):
+                if isinstance(result, commands.BadArgument):
+                    failed.append(arg)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    mentions[arg] = result.mention
+            if failed:
+                raise commands.BadArgument(f"Unable to convert {', '.join(failed)} to user or role mention.")
+
+        self.content = ", ".join(mentions.values()) or None
 
     def create_embed(
         self,
@@ -111,22 +196,28 @@ class AnnouncementModel:
             color = self.ctx.bot.main_color
         else:
             color = _color_converter(color)
-        embed = discord.Embed(description=description, color=color, timestamp=discord.utils.utcnow())
-        author = self.ctx.author
-        embed.set_author(name=str(author), icon_url=author.display_avatar)
+        embed = discord.Embed(description=description, color=color, timestamp=utcnow())
+        embed.set_author(name=self._author_name, icon_url=self._author_icon)
         if thumbnail_url:
             embed.set_thumbnail(url=thumbnail_url)
         if image_url:
             embed.set_image(url=image_url)
-        embed.set_footer(text="Announcement", icon_url=self.channel.guild.icon)
+        embed.set_footer(text="Announcement", icon_url=self._guild_icon)
         self.embed = embed
         return embed
 
     def send_params(self) -> Dict[str, Any]:
-        params = {"embed": self.embed}
-        if self.content:
-            params["content"] = self.content
-        return params
+        """
+        Returns the keyword arguments to send the announcement with.
+
+        The result is cached until either the content or the embed is reassigned.
+        """
+        if self._send_params is None:
+            params = {"embed": self.embed}
+            if self.content:
+                params["content"] = self.content
+            self._send_params = params
+        return self._send_params
 
     async def post(self) -> None:
         self.message = await self.channel.send(**self.send_params())
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Union, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Union, TYPE_CHECKING
 
 import discord
 from discord import ButtonStyle, Interaction, TextStyle
@@ -19,6 +20,9 @@ if TYPE_CHECKING:
 
 
 _max_embed_length = 6000
+_max_session_duration = 3600.0
+
+_embed_type = AnnouncementType.EMBED
 _short_length = 256
 _long_length = 4000
 
@@ -38,6 +42,78 @@ _embed_input_description = (
 
 _plain_input_description = "Click the `Edit` button below to set/edit the content."
 
+# full panel descriptions for each announcement type, there are only a few so just build them once
+_type_descriptions: Mapping[AnnouncementType, str] = MappingProxyType(
+    {
+        AnnouncementType.NORMAL: f"__**Normal:**__\n{_plain_input_description}",
+        _embed_type: f"__**Embed:**__\n{_embed_input_description}",
+    }
+)
+
+# templates for text inputs, these are read-only and will be copied for each view since
+# the "default" value is modified on modal submit
+_content_input: Mapping[str, Any] = MappingProxyType(
+    {
+        "label": "Content",
+        "default": None,
+        "style": TextStyle.long,
+        "max_length": _long_length,
+    }
+)
+_mention_input: Mapping[str, Any] = MappingProxyType(
+    {
+        "label": "Mention",
+        "default": "@here",
+        "required": False,
+        "max_length": _short_length,
+    }
+)
+_embed_inputs: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "description": MappingProxyType(
+            {
+                "label": "Announcement",
+                "style": TextStyle.long,
+                "max_length": _long_length,
+            }
+        ),
+        "thumbnail_url": MappingProxyType(
+            {
+                "label": "Thumbnail URL",
+                "required": False,
+                "max_length": _short_length,
+            }
+        ),
+        "image_url": MappingProxyType(
+            {
+                "label": "Image URL",
+                "required": False,
+                "max_length": _short_length,
+            }
+        ),
+        "color": MappingProxyType(
+            {
+                "label": "Embed color",
+                "required": False,
+                "max_length": 20,
+            }
+        ),
+    }
+)
+
+_type_options: Tuple[discord.SelectOption, ...] = (
+    discord.SelectOption(
+        label="Normal",
+        description="Plain text announcement.",
+        value="normal",
+    ),
+    discord.SelectOption(
+        label="Embed",
+        description="Embedded announcement. Image and thumbnail image are alose supported.",
+        value="embed",
+    ),
+)
+
 
 class AnnouncementTextInput(TextInput):
     def __init__(self, name: str, **kwargs):
@@ -52,15 +128,17 @@ class AnnouncementModal(Modal):
     def __init__(self, view: AnnouncementView, options: Dict[str, Any]):
         super().__init__(title="Announcement")
         self.view = view
-        self.view.modals.append(self)
         for key, value in options.items():
             self.add_item(AnnouncementTextInput(key, **value))
 
     async def on_submit(self, interaction: Interaction) -> None:
+        # acknowledge first, everything below does not need the interaction response
+        await interaction.response.defer()
         for child in self.children:
             self.view.inputs[child.name]["default"] = child.value
 
-        await interaction.response.defer()
+        if self.view.active_modal is self:
+            self.view.active_modal = None
         self.stop()
         await self.view.on_modal_submit(interaction)
 
@@ -85,12 +163,14 @@ class DropdownMenu(Select):
 class AnnouncementViewButton(Button["AnnouncementView"]):
     def __init__(
         self,
+        key: str,
         *,
-        label: str,
         style: ButtonStyle = ButtonStyle.blurple,
+        disabled: bool = False,
         callback: ButtonCallbackT = MISSING,
     ):
-        super().__init__(label=label, style=style)
+        super().__init__(label=key.title(), style=style, disabled=disabled)
+        self.key: str = key
         self.callback_override: ButtonCallbackT = callback
 
     async def callback(self, interaction: Interaction):
@@ -102,111 +182,79 @@ class AnnouncementView(View):
 
     children: List[AnnouncementViewButton]
 
+    # (key, style, callback name) of the buttons, the callbacks are bound per instance
+    _button_specs: Tuple[Tuple[str, ButtonStyle, str], ...] = (
+        ("post", ButtonStyle.green, "_action_post"),
+        ("edit", ButtonStyle.grey, "_action_edit"),
+        ("preview", ButtonStyle.grey, "_action_preview"),
+        ("cancel", ButtonStyle.red, "_action_cancel"),
+    )
+    _confirmation_button_specs: Tuple[Tuple[str, ButtonStyle, str], ...] = (
+        ("yes", ButtonStyle.green, "_action_yes"),
+        ("no", ButtonStyle.red, "_action_no"),
+    )
+
     def __init__(self, ctx: commands.Context, announcement: AnnouncementModel, *, timeout: float = 600.0):
         super().__init__(timeout=timeout)
         self.ctx: commands.Context = ctx
         self.cog: AnnouncementCog = ctx.cog
         self.user: discord.Member = ctx.author
+        self._user_id: int = ctx.author.id
         self.message: discord.Message = MISSING
         self.announcement: AnnouncementModel = announcement
         self.confirm: Optional[bool] = None
-        self._underlying_modals: List[AnnouncementModal] = []
-
-        self.content_data: Dict[str, Any] = {
-            "label": "Content",
-            "default": None,
-            "style": TextStyle.long,
-            "max_length": _long_length,
-        }
-        self.embed_data: Dict[str, Any] = {
-            "description": {
-                "label": "Announcement",
-                "style": TextStyle.long,
-                "max_length": _long_length,
-            },
-            "thumbnail_url": {
-                "label": "Thumbnail URL",
-                "required": False,
-                "max_length": _short_length,
-            },
-            "image_url": {
-                "label": "Image URL",
-                "required": False,
-                "max_length": _short_length,
-            },
-            "color": {
-                "label": "Embed color",
-                "required": False,
-                "max_length": 20,
-            },
-        }
+        self.active_modal: Optional[AnnouncementModal] = None
+        self._last_state: Optional[Tuple[Optional[str], List[Dict[str, Any]]]] = None
+        self._buttons: List[AnnouncementViewButton] = []
+
+        self.content_data: Dict[str, Any] = dict(_content_input)
+        self.embed_data: Dict[str, Any] = {key: dict(value) for key, value in _embed_inputs.items()}
         self.inputs: Dict[str, Any] = {"content": self.content_data}
 
         self._add_menu()
         self.generate_buttons()
-        self.refresh()
-
-    @property
-    def modals(self) -> List[AnnouncementModal]:
-        return self._underlying_modals
 
     def _add_menu(self) -> None:
-        attrs = [
-            {
-                "label": "Normal",
-                "emoji": None,
-                "description": "Plain text announcement.",
-            },
-            {
-                "label": "Embed",
-                "emoji": None,
-                "description": "Embedded announcement. Image and thumbnail image are alose supported.",
-            },
-        ]
-        options = []
-        for attr in attrs:
-            option = discord.SelectOption(
-                label=attr["label"],
-                emoji=attr["emoji"],
-                description=attr["description"],
-                value=attr["label"].lower(),
-            )
-            options.append(option)
-        self.add_item(DropdownMenu(options=options, row=0))
+        self.add_item(DropdownMenu(options=list(_type_options), row=0))
 
     def generate_buttons(self, *, confirmation: bool = False) -> None:
-        if confirmation:
-            buttons = {
-                "yes": (ButtonStyle.green, self._action_yes),
-                "no": (ButtonStyle.red, self._action_no),
-            }
-        else:
-            buttons: Dict[str, Any] = {
-                "post": (ButtonStyle.green, self._action_post),
-                "edit": (ButtonStyle.grey, self._action_edit),
-                "preview": (ButtonStyle.grey, self._action_preview),
-                "cancel": (ButtonStyle.red, self._action_cancel),
-            }
-        for label, item in buttons.items():
-            self.add_item(AnnouncementViewButton(label=label.title(), style=item[0], callback=item[1]))
+        specs = self._confirmation_button_specs if confirmation else self._button_specs
+        for key, style, callback_name in specs:
+            button = AnnouncementViewButton(
+                key,
+                style=style,
+                disabled=self._should_disable(key),
+                callback=getattr(self, callback_name),
+            )
+            self.add_item(button)
+            self._buttons.append(button)
+
+    def _should_disable(self, key: str) -> bool:
+        if key == "cancel":
+            return False
+        if not self.announcement.type:
+            return True
+        if key in ("post", "preview"):
+            return not self.announcement.ready
+        return False
 
     def refresh(self) -> None:
-        for child in self.children:
-            if not isinstance(child, AnnouncementViewButton):
-                continue
-            if child.label.lower() == "cancel":
-                continue
-            if not self.announcement.type:
-                child.disabled = True
-                continue
-            if child.label.lower() in ("post", "preview"):
-                child.disabled = not self.announcement.ready
-            else:
-                child.disabled = False
+        should_disable = self._should_disable
+        for button in self._buttons:
+            button.disabled = should_disable(button.key)
+
+    def clear_items(self) -> AnnouncementView:
+        self._buttons.clear()
+        return super().clear_items()
 
     async def update_view(self) -> None:
         self.refresh()
-        await self.message.edit(embed=self.message.embeds[0], view=self)
+        embed = self.message.embeds[0]
+        state = (embed.description, self.to_components())
+        if state == self._last_state:
+            return
+        await self.message.edit(embed=embed, view=self)
+        self._last_state = state
 
     async def _action_post(self, interaction: Interaction) -> None:
         await interaction.response.defer()
@@ -214,16 +262,20 @@ class AnnouncementView(View):
         self.clear_items()
 
     async def _action_edit(self, interaction: Interaction) -> None:
-        modal = AnnouncementModal(self, self.inputs)
+        self._stop_active_modal()
+        self.active_modal = modal = AnnouncementModal(self, self.inputs)
+        # the rest is handled in `AnnouncementModal.on_submit`
         await interaction.response.send_modal(modal)
-        await modal.wait()
 
     async def _action_preview(self, interaction: Interaction) -> None:
         try:
             await interaction.response.send_message(ephemeral=True, **self.announcement.send_params())
         except discord.HTTPException as exc:
             error = f"**Error:**\n```py\n{type(exc).__name__}: {str(exc)}\n```"
-            await interaction.response.send_message(error, ephemeral=True)
+            if interaction.response.is_done():
+                await interaction.followup.send(error, ephemeral=True)
+            else:
+                await interaction.response.send_message(error, ephemeral=True)
 
     async def _action_cancel(self, interaction: Interaction) -> None:
         self.announcement.posted = False
@@ -241,7 +293,7 @@ class AnnouncementView(View):
         self.disable_and_stop()
 
     async def interaction_check(self, interaction: Interaction) -> bool:
-        if self.user.id == interaction.user.id:
+        if self._user_id == interaction.user.id:
             return True
         await interaction.response.send_message(
             "This panel cannot be controlled by you!",
@@ -251,39 +303,26 @@ class AnnouncementView(View):
 
     async def set_announcement_type(self, value: str) -> None:
         self.announcement.type = AnnouncementType.from_value(value)
-        description = f"__**{value.title()}:**__\n"
-        if self.announcement.type == AnnouncementType.EMBED:
-            self.content_data = {
-                "label": "Mention",
-                "default": "@here",
-                "required": False,
-                "max_length": _short_length,
-            }
+        if self.announcement.type is _embed_type:
+            self.content_data = dict(_mention_input)
             self.inputs.update(content=self.content_data, **self.embed_data)
-            description += _embed_input_description
-        else:
-            description += _plain_input_description
         embed = self.message.embeds[0]
+        description = _type_descriptions.get(self.announcement.type)
+        if description is None:
+            # not one of the listed types, e.g. `AnnouncementType.INVALID`
+            description = f"__**{value.title()}:**__\n{_plain_input_description}"
         embed.description = description
         await self.update_view()
 
     async def on_modal_submit(self, interaction: Interaction) -> None:
         self.announcement.content = self.inputs["content"].get("default")
         errors = []
-        if self.announcement.type == AnnouncementType.EMBED:
+        if self.announcement.type is _embed_type:
             try:
                 await self.announcement.resolve_mentions()
             except commands.BadArgument as exc:
                 errors.append(str(exc))
-            kwargs = {}
-            elems = [
-                "description",
-                "thumbnail_url",
-                "image_url",
-                "color",
-            ]
-            for elem in elems:
-                kwargs = {elem: self.inputs[elem].get("default") for elem in elems}
+            kwargs = {elem: self.inputs[elem].get("default") for elem in _embed_inputs}
             try:
                 self.announcement.create_embed(**kwargs)
             except Exception as exc:
@@ -291,7 +330,7 @@ class AnnouncementView(View):
 
         if errors:
             self.announcement.ready = False
-            content = "\n".join(f"{n}. {error}" for n, error in enumerate(errors, start=1))
+            content = "\n".join([f"{n}. {error}" for n, error in enumerate(errors, start=1)])
             embed = discord.Embed(
                 title="__Errors__",
                 color=self.ctx.bot.error_color,
@@ -304,16 +343,24 @@ class AnnouncementView(View):
 
     async def wait(self, *, input_event: bool = False) -> None:
         if input_event:
-            await self.announcement.wait()
+            await self.announcement.wait(timeout=_max_session_duration)
+            if not self.announcement.posted and not self.is_finished():
+                # the session has exceeded the maximum duration
+                await self.on_timeout()
         else:
             await super().wait()
 
+    def _stop_active_modal(self) -> None:
+        modal = self.active_modal
+        if modal is None:
+            return
+        modal.stop()
+        self.active_modal = None
+
     def disable_and_stop(self) -> None:
         for child in self.children:
             child.disabled = True
-        for modal in self.modals:
-            if modal.is_dispatching() or not modal.is_finished():
-                modal.stop()
+        self._stop_active_modal()
         if not self.is_finished():
             self.stop()
 
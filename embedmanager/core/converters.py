@@ -12,6 +12,45 @@ from discord.ext.commands import (
     TextChannelConverter,
 )
 
+try:
+    # optional, faster JSON parser. its `JSONDecodeError` is a subclass of `json.JSONDecodeError`
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_max_embed_length = 6000
+
+_message_converter = MessageConverter()
+_text_channel_converter = TextChannelConverter()
+
+
+def _text_length(data: dict, key: str) -> int:
+    value = data.get(key)
+    return len(value) if isinstance(value, str) else 0
+
+
+def _raw_embed_length(data: dict) -> int:
+    """
+    Sums the length of the texts that count towards the embed size limit from raw embed data.
+
+    Values that are not strings are skipped, so the result never exceeds the length of the
+    resulting embed.
+    """
+    length = _text_length(data, "title") + _text_length(data, "description")
+    for key, sub_key in (("author", "name"), ("footer", "text")):
+        entity = data.get(key)
+        if isinstance(entity, dict):
+            length += _text_length(entity, sub_key)
+    fields = data.get("fields")
+    if isinstance(fields, list):
+        for field in fields:
+            if isinstance(field, dict):
+                length += _text_length(field, "name") + _text_length(field, "value")
+    return length
+
 
 class StringToEmbed(Converter):
     def __init__(self, content: bool = False):
@@ -19,19 +58,19 @@ class StringToEmbed(Converter):
         self.allow_content = content
 
     async def convert(self, ctx: commands.Context, argument: str) -> discord.Embed:
-        data = argument.strip("`")
-        data = await self.load_from_json(ctx, data)
+        data = await self.load_from_json(ctx, argument.strip("`"), data_type=dict)
         content = self.get_content(data)
 
+        # the top level data has been checked above, only the unwrapped one needs to be checked again
         if data.get("embed"):
             data = data["embed"]
+            self.check_data_type(ctx, data, data_type=dict)
         elif data.get("embeds"):
-            data = data.get("embeds")[0]
-        self.check_data_type(ctx, data)
+            data = data["embeds"][0]
+            self.check_data_type(ctx, data, data_type=dict)
 
         fields = await self.create_embed(ctx, data, content=content)
-        embed = fields["embed"]
-        return embed
+        return fields["embed"]
 
     def check_data_type(self, ctx: commands.Context, data, *, data_type=(dict, list)):
         if not isinstance(data, data_type):
@@ -42,7 +81,7 @@ class StringToEmbed(Converter):
 
     async def load_from_json(self, ctx: commands.Context, data: str, **kwargs) -> dict:
         try:
-            data = json.loads(data)
+            data = _json_loads(data)
         except json.decoder.JSONDecodeError as error:
             return await self.embed_convert_error(ctx, "JSON Parse Error", error)
         self.check_data_type(ctx, data, **kwargs)
@@ -59,13 +98,18 @@ class StringToEmbed(Converter):
     ) -> Dict[str, Union[discord.Embed, str]]:
         content = self.get_content(data, content=content)
 
+        # cheap check on the raw data first, so oversized data is rejected without building the embed
+        length = _raw_embed_length(data)
+        if length > _max_embed_length:
+            raise BadArgument(f"Embed size exceeds Discord limit of 6000 characters ({length}).")
+
         timestamp = data.get("timestamp")
         if timestamp:
             data["timestamp"] = timestamp.strip("Z")
         try:
             e = discord.Embed.from_dict(data)
             length = len(e)
-            if length > 6000:
+            if length > _max_embed_length:
                 raise BadArgument(f"Embed size exceeds Discord limit of 6000 characters ({length}).")
         except BadArgument:
             raise
@@ -114,8 +158,11 @@ class ListStringToEmbed(StringToEmbed):
 
 class StoredEmbedConverter(Converter):
     async def convert(self, ctx: commands.Context, name: str) -> dict:
-        cog = ctx.cog
-        data = await cog.db_config()  # can only be used within this cog
+        # fetch the config once per command invocation, in case this converter is used more than once
+        data = getattr(ctx, "_stored_embeds_config", None)
+        if data is None:
+            data = await ctx.cog.db_config()  # can only be used within this cog
+            ctx._stored_embeds_config = data
         embeds = data.get("embeds", {})
         embed = embeds.get(name)
         if not embed:
@@ -123,15 +170,11 @@ class StoredEmbedConverter(Converter):
 
         return embed
 
-    def __getitem__(self, item):
-        return self[item]
-
 
 class BotMessage(discord.Message):
     @classmethod
     async def convert(cls, ctx: commands.Context, argument: str) -> discord.Message:
-        converter = MessageConverter()
-        message = await converter.convert(ctx, argument)
+        message = await _message_converter.convert(ctx, argument)
         if message.author.id != ctx.me.id:
             raise BadArgument("That is not a message sent by me.")
         if not message.channel.permissions_for(ctx.me).send_messages:
@@ -144,8 +187,7 @@ class BotMessage(discord.Message):
 class MessageableChannel(discord.TextChannel):
     @classmethod
     async def convert(cls, ctx: commands.Context, argument: str) -> discord.TextChannel:
-        converter = TextChannelConverter()
-        channel = await converter.convert(ctx, argument)
+        channel = await _text_channel_converter.convert(ctx, argument)
         my_perms = channel.permissions_for(ctx.me)
         if not (my_perms.send_messages and my_perms.embed_links):
             raise BadArgument(f"I do not have permissions to send embeds in {channel.mention}.")
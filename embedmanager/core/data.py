@@ -1,4 +1,5 @@
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 from discord import TextStyle
 from discord.ext.modmail_utils import Limit
@@ -64,7 +65,7 @@ SHORT_DESCRIPTIONS = {
 
 FOOTER_TEXTS = {"length": "Total characters: {}/" + f"{Limit.embed}"}
 
-INPUT_DATA: Dict[str, Any] = {
+_input_data: Dict[str, Dict[str, Dict[str, Any]]] = {
     "title": {
         "title": {
             "label": "Title",
@@ -152,6 +153,14 @@ INPUT_DATA: Dict[str, Any] = {
     },
 }
 
+# read-only templates for text inputs, these are shared by all views so must be copied before modifying
+INPUT_DATA: Mapping[str, Mapping[str, Mapping[str, Any]]] = MappingProxyType(
+    {
+        category: MappingProxyType({name: MappingProxyType(options) for name, options in inputs.items()})
+        for category, inputs in _input_data.items()
+    }
+)
+
 JSON_EXAMPLE = """
 {
     "title": "JSON Example",
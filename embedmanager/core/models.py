@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, List, TYPE_CHECKING
+from typing import Any, Callable, Dict, Optional, List, TYPE_CHECKING
 
 import discord
 
@@ -117,37 +117,58 @@ class EmbedEditor:
         else:
             self.embed.set_field_at(index, name=name, value=value, inline=inline)
 
+    def _update_fields(self, embed: Embed, data: Dict[str, Any]) -> None:
+        self._set_field_at(data.pop("index"), **data)
+
+    def _update_title(self, embed: Embed, data: Dict[str, Any]) -> None:
+        title = data["title"]
+        embed.title = title
+        if title:
+            url = data["url"]
+        else:
+            url = None
+        embed.url = url
+
+    def _update_author(self, embed: Embed, data: Dict[str, Any]) -> None:
+        embed.set_author(**data)
+
+    def _update_body(self, embed: Embed, data: Dict[str, Any]) -> None:
+        embed.description = data["description"]
+        thumbnail_url = data["thumbnail"]
+        if thumbnail_url:
+            embed.set_thumbnail(url=thumbnail_url)
+        image_url = data["image"]
+        if image_url:
+            embed.set_image(url=image_url)
+
+    def _update_color(self, embed: Embed, data: Dict[str, Any]) -> None:
+        embed.colour = data["value"]
+
+    def _update_footer(self, embed: Embed, data: Dict[str, Any]) -> None:
+        embed.set_footer(**data)
+
+    def _update_timestamp(self, embed: Embed, data: Dict[str, Any]) -> None:
+        embed.timestamp = data["timestamp"]
+
+    # category to the unbound update method
+    _updaters: Dict[str, Callable[[EmbedEditor, Embed, Dict[str, Any]], None]] = {
+        "fields": _update_fields,
+        "title": _update_title,
+        "author": _update_author,
+        "body": _update_body,
+        "color": _update_color,
+        "footer": _update_footer,
+        "timestamp": _update_timestamp,
+    }
+
     def update(self, *, data: Dict[str, Any], category: str) -> Embed:
         """
         Update embed from the response data.
         """
-        embed = self.embed
-        if category == "fields":
-            self._set_field_at(data.pop("index"), **data)
-        elif category == "title":
-            title = data["title"]
-            embed.title = title
-            if title:
-                url = data["url"]
-            else:
-                url = None
-            embed.url = url
-        elif category == "author":
-            embed.set_author(**data)
-        elif category == "body":
-            embed.description = data["description"]
-            thumbnail_url = data["thumbnail"]
-            if thumbnail_url:
-                embed.set_thumbnail(url=thumbnail_url)
-            image_url = data["image"]
-            if image_url:
-                embed.set_image(url=image_url)
-        elif category == "color":
-            embed.colour = data["value"]
-        elif category == "footer":
-            embed.set_footer(**data)
-        elif category == "timestamp":
-            embed.timestamp = data["timestamp"]
-        else:
+        try:
+            updater = self._updaters[category]
+        except KeyError:
             raise TypeError(f"`{category}` is invalid category.")
+        embed = self.embed
+        updater(self, embed, data)
         return embed
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 from copy import deepcopy
 from datetime import datetime
-from distutils.util import strtobool
-from typing import Any, Awaitable, Callable, Dict, Optional, List, Union, TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional, List, Tuple, Union, TYPE_CHECKING
 
 import discord
 from discord import ButtonStyle, Interaction
@@ -23,6 +23,7 @@ if TYPE_CHECKING:
     ButtonCallbackT = Callable[[Union[Interaction, Any]], Awaitable]
 
 
+@lru_cache(maxsize=128)
 def _color_converter(value: str) -> int:
     try:
         return int(discord.Color.from_str(value))
@@ -30,22 +31,40 @@ def _color_converter(value: str) -> int:
         raise ValueError(f"`{value}` is unknown color format.")
 
 
+# same values as accepted by `distutils.util.strtobool`
+_bool_values: Dict[str, bool] = {
+    "y": True,
+    "yes": True,
+    "t": True,
+    "true": True,
+    "on": True,
+    "1": True,
+    "n": False,
+    "no": False,
+    "f": False,
+    "false": False,
+    "off": False,
+    "0": False,
+}
+
+
 def _bool_converter(value: str) -> bool:
     if not value:
         return False
     try:
-        return strtobool(value)
-    except ValueError:
+        return _bool_values[value.lower()]
+    except KeyError:
         raise ValueError(f"`{value}` is unknown boolean value.")
 
 
+@lru_cache(maxsize=128)
 def _url_checker(value: str) -> str:
     if not value:
         return ""
     url = URL(value)
     if url.scheme not in ("http", "https"):
         raise ValueError("Invalid url schema. URLs must start with either `http` or `https`.")
-    if "." not in url.host:
+    if "." not in (url.host or ""):
         raise ValueError(f"Not a well formed URL, `{value}`.")
     return str(url)
 
@@ -64,16 +83,31 @@ def _timestamp_converter(value: Optional[str]) -> str:
             raise ValueError(f"`{value}` is not a valid format for timestamp.")
 
 
+# (category, input name) to converter, inputs that are not listed here are used as is
+_converters: Dict[Tuple[str, str], Callable[[str], Any]] = {
+    ("title", "url"): _url_checker,
+    ("author", "icon_url"): _url_checker,
+    ("author", "url"): _url_checker,
+    ("body", "thumbnail"): _url_checker,
+    ("body", "image"): _url_checker,
+    ("color", "value"): _color_converter,
+    ("footer", "icon_url"): _url_checker,
+    ("fields", "inline"): _bool_converter,
+    ("timestamp", "timestamp"): _timestamp_converter,
+}
+
+
 def _resolve_conversion(key: str, sub_key: str, value: str) -> Any:
-    if sub_key in ("url", "icon_url", "thumbnail", "image"):
-        return _url_checker(value)
-    if key == "color":
-        return _color_converter(value)
-    if key == "fields" and sub_key == "inline":
-        return _bool_converter(value)
-    if key == "timestamp":
-        return _timestamp_converter(value)
-    return value
+    converter = _converters.get((key, sub_key))
+    if converter is None:
+        return value
+    return converter(value)
+
+
+# category to (label, description) of its select option
+_category_option_specs: Dict[str, Tuple[str, str]] = {
+    key: (key.title(), SHORT_DESCRIPTIONS[key]) for key in INPUT_DATA
+}
 
 
 class FieldEditorView(muui.View):
@@ -155,10 +189,11 @@ class FieldEditorView(muui.View):
 
     @ui.select(placeholder="Select a field", row=0)
     async def _field_select(self, interaction: Interaction, select: ui.Select) -> None:
-        value = select.values[0]
-        for opt in select.options:
-            opt.default = opt.value == value
-        self.index = int(value)
+        # options are populated in index order, so only the previous and the new ones need to be updated
+        index = int(select.values[0])
+        select.options[self.index].default = False
+        select.options[index].default = True
+        self.index = index
         await self.update(interaction)
 
     @ui.button(label="New", style=ButtonStyle.blurple)
@@ -170,9 +205,11 @@ class FieldEditorView(muui.View):
 
     @ui.button(label="Edit", style=ButtonStyle.grey)
     async def _action_edit_field(self, interaction: Interaction, button: ui.Button) -> None:
-        options = self.handler.extras[self.handler.category]
-        for key, value in self.raw_fields[self.index].items():
-            options[key]["default"] = value
+        # copy the templates instead of writing the defaults into the shared ones
+        field = self.raw_fields[self.index]
+        options = {}
+        for key, value in self.handler.extras[self.handler.category].items():
+            options[key] = dict(value, default=field.get(key))
         modal = muui.Modal(
             self,
             options,
@@ -193,22 +230,15 @@ class FieldEditorView(muui.View):
     @ui.button(label="Exit", style=ButtonStyle.red)
     async def _action_exit_fields(self, interaction: Interaction, button: ui.Button) -> None:
         await interaction.response.defer()
-        for f in self.raw_fields:
-            # remove any unset element
-            if f == self.__default:
-                self.raw_fields.remove(f)
+        # remove any unset element
+        self.raw_fields[:] = [f for f in self.raw_fields if f != self.__default]
         self.stop()
 
     async def _parse_inputs(self, interaction: Interaction, modal: muui.Modal) -> None:
-        data = {}
-        for child in modal.children:
-            value = child.value
-            if not value:
-                value = None
-            data[child.name] = value
+        data = {child.name: child.value or None for child in modal.children}
         self.raw_fields[self.index] = data
         resolved = {"index": self.index}
-        for key, value in list(data.items()):
+        for key, value in data.items():
             if key == "inline":
                 if value is None:
                     # defaults to True
@@ -244,7 +274,8 @@ class EmbedBuilderView(muui.View):
         editor: EmbedEditor = MISSING,
         timeout: float = 300.0,
     ):
-        super().__init__(extras=deepcopy(INPUT_DATA), timeout=timeout)
+        # the input templates are never modified, the modal payloads are built from copies of them
+        super().__init__(extras=dict(INPUT_DATA), timeout=timeout)
         self.bot: ModmailBot = cog.bot
         self.cog: EmbedManager = cog
         self.editor: EmbedEditor = editor if editor is not MISSING else EmbedEditor(cog)
@@ -266,15 +297,23 @@ class EmbedBuilderView(muui.View):
                     default=default,
                 ),
             )
-        self._category_select.options.clear()
-        for key in self.extras:
-            option = discord.SelectOption(
-                label=key.title(),
-                description=SHORT_DESCRIPTIONS[key],
-                value=key,
-                default=key == self.category,
-            )
-            self._category_select.append_option(option)
+        category_options = self._category_select.options
+        if not category_options:
+            for key in self.extras:
+                label, description = _category_option_specs[key]
+                self._category_select.append_option(
+                    discord.SelectOption(
+                        label=label,
+                        description=description,
+                        value=key,
+                        default=key == self.category,
+                    )
+                )
+        else:
+            # the categories never change, only the selected one needs to be updated.
+            # the options may have been replaced after a message edit, so look them up from the select
+            for option in category_options:
+                option.default = option.value == self.category
 
     def refresh(self) -> None:
         for child in self.children:
@@ -324,9 +363,12 @@ class EmbedBuilderView(muui.View):
 
     @ui.select(placeholder="Select a category", row=1)
     async def _category_select(self, interaction: Interaction, select: ui.Select) -> None:
-        self.category = value = select.values[0]
-        for opt in select.options:
-            opt.default = opt.value == value
+        value = select.values[0]
+        # the options may be replaced with the ones parsed from the message after each edit,
+        # so always work on the current ones
+        for option in select.options:
+            option.default = option.value == value
+        self.category = value
         embed = self.message.embeds[0]
         embed.description = "\n".join(DESCRIPTIONS[value])
         await self.update(interaction)
@@ -363,12 +405,13 @@ class EmbedBuilderView(muui.View):
                 view.message = await interaction.followup.send(embeds=embeds, view=view)
                 await view.wait()
         else:
-            payload = deepcopy(self.extras[self.category])
-            for key in list(payload.keys()):
-                try:
-                    payload[key]["default"] = self.editor[self.category][key]
-                except KeyError:
-                    continue
+            # the templates are flat mappings, a shallow copy of each is enough to set the defaults
+            inputs = self.editor[self.category]
+            payload = {}
+            for key, value in self.extras[self.category].items():
+                payload[key] = options = dict(value)
+                if key in inputs:
+                    options["default"] = inputs[key]
             modal = muui.Modal(
                 self,
                 payload,
@@ -395,16 +438,12 @@ class EmbedBuilderView(muui.View):
         await interaction.response.edit_message(view=self)
 
     async def on_modal_submit(self, interaction: Interaction, modal: muui.Modal) -> None:
-        for child in modal.children:
-            value = child.value
-            if not value:
-                value = None
-            self.editor[self.category][child.name] = value
+        data = self.editor[self.category]
+        data.update({child.name: child.value or None for child in modal.children})
 
         errors = []
-        data = self.editor[self.category]
         resp_data = {}
-        for key, value in list(data.items()):
+        for key, value in data.items():
             try:
                 value = _resolve_conversion(self.category, key, value)
             except Exception as exc:
@@ -58,6 +58,10 @@ JSON_CONTENT_CONVERTER = StringToEmbed(content=True)
 YES_EMOJI = "\N{WHITE HEAVY CHECK MARK}"
 NO_EMOJI = "\N{CROSS MARK}"
 
+BUILDER_PANEL_DESCRIPTION = (
+    "Select the category and press the button below respectively to start creating/editing your embed."
+)
+
 
 class EmbedManager(commands.Cog, name=__plugin_name__):
     __doc__ = __description__
@@ -148,10 +152,9 @@ class EmbedManager(commands.Cog, name=__plugin_name__):
         """
         Build embeds in an interactive mode using buttons and text input view.
         """
-        description = "Select the category and press the button below respectively to start creating/editing your embed."
         embed = discord.Embed(
             title="Embed Builder Panel",
-            description=description,
+            description=BUILDER_PANEL_DESCRIPTION,
             color=self.bot.main_color,
             timestamp=discord.utils.utcnow(),
         )
@@ -254,10 +257,9 @@ class EmbedManager(commands.Cog, name=__plugin_name__):
                 f"Index `{index}` is out of range. Expected `0` to `{len(message.embeds) - 1}`."
             )
         view = EmbedBuilderView.from_embeds(self, ctx.author, embeds=message.embeds, index=index)
-        description = "Select the category and press the button below respectively to start creating/editing your embed."
         embed = discord.Embed(
             title="Embed Editor",
-            description=description,
+            description=BUILDER_PANEL_DESCRIPTION,
             color=self.bot.main_color,
             timestamp=discord.utils.utcnow(),
         )
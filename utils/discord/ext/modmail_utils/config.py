@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import copy as copylib
-from typing import Any, Dict, ItemsView, List, Optional, TypeVar, Union, TYPE_CHECKING
+from typing import Any, Dict, ItemsView, KeysView, Optional, TypeVar, Union, ValuesView, TYPE_CHECKING
 
 from discord.ext import commands
 
@@ -23,6 +23,26 @@ VT = TypeVar("VT")
 KT = TypeVar("KT")
 DataT = Dict[KT, VT]
 
+_immutable_types = frozenset({str, int, float, bool, type(None)})
+
+
+def _fast_deepcopy(obj: TypeT) -> TypeT:
+    """
+    A deep copy specialised for JSON-like data. Dictionaries, lists and tuples are copied
+    recursively and immutable scalars are returned as is. Any other type of object
+    fallbacks to `copy.deepcopy`.
+    """
+    obj_type = type(obj)
+    if obj_type in _immutable_types:
+        return obj
+    if obj_type is dict:
+        return {k: _fast_deepcopy(v) for k, v in obj.items()}
+    if obj_type is list:
+        return [_fast_deepcopy(v) for v in obj]
+    if obj_type is tuple:
+        return tuple(_fast_deepcopy(v) for v in obj)
+    return copylib.deepcopy(obj)
+
 
 class BaseConfig:
     """
@@ -40,6 +60,8 @@ class BaseConfig:
         Defaults to `True`.
     """
 
+    __slots__ = ("cog", "bot", "defaults", "_use_cache", "_cache")
+
     def __init__(self, cog: CogT, *, defaults: DataT = None, use_cache: bool = True):
         self.cog: CogT = cog
         self.bot: ModmailBot = cog.bot
@@ -66,19 +88,19 @@ class BaseConfig:
         return self._cache
 
     def __setitem__(self, key: KT, item: VT) -> None:
-        if not self.cache_enabled():
+        if not self._use_cache:
             raise NotImplementedError("Method is not allowed due to disabled cache.")
         if not isinstance(key, str):
             raise TypeError(f"Expected str object for parameter key, got {type(key).__name__} instead.")
         self._cache[key] = item
 
     def __getitem__(self, key: KT) -> VT:
-        if not self.cache_enabled():
+        if not self._use_cache:
             raise NotImplementedError("Method is not allowed due to disabled cache.")
         return self._cache[key]
 
     def __delitem__(self, key: KT) -> None:
-        if not self.cache_enabled():
+        if not self._use_cache:
             raise NotImplementedError("Method is not allowed due to disabled cache.")
         del self._cache[key]
 
@@ -102,21 +124,21 @@ class BaseConfig:
         if restore_default:
             self._cache[key] = self.deepcopy(self.defaults[key])
 
-    def keys(self) -> List[KT]:
+    def keys(self) -> KeysView[KT]:
         """
-        Returns the list of config keys.
+        Returns a view of config keys.
         """
         return self._cache.keys()
 
-    def values(self) -> List[VT]:
+    def values(self) -> ValuesView[VT]:
         """
-        Returns the list of config values.
+        Returns a view of config values.
         """
         return self._cache.values()
 
     def items(self) -> ItemsView[KT, VT]:
         """
-        Returns a sequence of key value pair tuples.
+        Returns a view of key value pair tuples.
         """
         return self._cache.items()
 
@@ -132,7 +154,7 @@ class BaseConfig:
         """
         Returns a deep copy of object.
         """
-        return copylib.deepcopy(obj)
+        return _fast_deepcopy(obj)
 
     def _recursive_resolve_keys(
         self,
@@ -174,6 +196,8 @@ class Config(BaseConfig):
     This class inherits from :class:`BaseConfig` with additional of database support.
     """
 
+    __slots__ = ("db", "_id")
+
     def __init__(self, cog: CogT, db: AsyncIOMotorCollection, **kwargs: Any):
         self._id: str = kwargs.pop("_id", "config")
         super().__init__(cog, **kwargs)
@@ -213,7 +237,7 @@ class Config(BaseConfig):
         if self.defaults is not None and resolve_default_keys:
             self._recursive_resolve_keys(self.defaults, data)
 
-        if self.cache_enabled():
+        if self._use_cache:
             self.refresh(data=data)
         return data
 
@@ -232,18 +256,21 @@ class Config(BaseConfig):
             Whether to refresh the cache after the operation. Defaults to  `False`.
         """
         if data is None:
-            if not self.cache_enabled() or not self.cache:
+            if not self._use_cache or not self._cache:
                 # kind of security to prevent data lost
                 raise ValueError("Cache is disabled or empty, data parameter must be provided.")
             data = self._cache
+        if not refresh:
+            # the updated document is not needed, so do not let the server send it back
+            await self.db.update_one({"_id": self._id}, {"$set": data}, upsert=True)
+            return
         new_data = await self.db.find_one_and_update(
             {"_id": self._id},
             {"$set": data},
             upsert=True,
             return_document=True,
         )
-        if refresh:
-            self.refresh(data=new_data)
+        self.refresh(data=new_data)
 
     def refresh(self, *, data: DataT) -> None:
         """
@@ -254,7 +281,6 @@ class Config(BaseConfig):
         data : DataT
             The data to cache.
         """
-        if not self.cache_enabled():
+        if not self._use_cache:
             raise NotImplementedError("Method is not allowed due to disabled cache.")
-        for key, value in data.items():
-            self._cache[key] = value
+        self._cache.update(data)
@@ -1,5 +1,5 @@
+import calendar
 from datetime import datetime, timedelta, timezone
-from dateutil.relativedelta import relativedelta
 from typing import Literal, Optional, SupportsInt
 
 import discord
@@ -14,6 +14,18 @@ __all__ = (
 )
 
 
+def _add_months(dt: datetime, months: int) -> datetime:
+    """
+    Shifts the datetime by the number of months. The day will be clipped to the last day
+    of the resulting month if it is out of range, e.g. Jan 31 + 1 month = Feb 28 (or 29).
+    """
+    year, month = divmod(dt.month - 1 + months, 12)
+    year += dt.year
+    month += 1
+    day = min(dt.day, calendar.monthrange(year, month)[1])
+    return dt.replace(year=year, month=month, day=day)
+
+
 def human_timedelta(dt: datetime, *, source: datetime = None) -> str:
     """
     Convert datetime object to human readable string.
@@ -32,20 +44,34 @@ def human_timedelta(dt: datetime, *, source: datetime = None) -> str:
         dt = dt.replace(tzinfo=timezone.utc)
 
     if dt > now:
-        delta = relativedelta(dt, now)
+        later, earlier = dt, now
         suffix = ""
     else:
-        delta = relativedelta(now, dt)
+        later, earlier = now, dt
         suffix = " ago"
 
-    if delta.microseconds and delta.seconds:
-        delta = delta + relativedelta(seconds=+1)
+    # same calendar arithmetic as `dateutil.relativedelta`, count the whole months first
+    # and then the remainder as a plain timedelta
+    months = (later.year - earlier.year) * 12 + later.month - earlier.month
+    shifted = _add_months(earlier, months)
+    while later < shifted:
+        months -= 1
+        shifted = _add_months(earlier, months)
+    years, months = divmod(months, 12)
+
+    remainder = later - shifted
+    seconds = remainder.days * 86400 + remainder.seconds
+    if remainder.microseconds and seconds % 60:
+        seconds += 1
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
 
     attrs = ["years", "months", "days", "hours", "minutes", "seconds"]
+    values = [years, months, days, hours, minutes, seconds]
 
     output = []
-    for attr in attrs:
-        elem = getattr(delta, attr)
+    for attr, elem in zip(attrs, values):
         if not elem:
             continue
 
@@ -56,11 +82,24 @@ def human_timedelta(dt: datetime, *, source: datetime = None) -> str:
 
     if not output:
         return "now"
-    if len(output) == 1:
-        return output[0] + suffix
-    if len(output) == 2:
-        return f"{output[0]} and {output[1]}{suffix}"
-    return f"{output[0]}, {output[1]} and {output[2]}{suffix}"
+    # only the three most significant units are shown
+    return human_join(output[:3], final="and") + suffix
+
+
+# (singular, plural, seconds) for each period, used in `humanize_timedelta`
+_periods = (
+    ("year", "years", 60 * 60 * 24 * 365),
+    ("month", "months", 60 * 60 * 24 * 30),
+    ("day", "days", 60 * 60 * 24),
+    ("hour", "hours", 60 * 60),
+    ("minute", "minutes", 60),
+    ("second", "seconds", 1),
+)
+
+
+# (start, stop) slices of (years, months, days, hours, minutes, seconds) to show in `age`,
+# indexed by the most significant non-zero value
+_age_ranges = ((0, 3), (1, 3), (2, 4), (3, 5), (4, 6), (5, 6))
 
 
 def humanize_timedelta(
@@ -92,23 +131,14 @@ def humanize_timedelta(
         The function was called with neither a number of seconds nor a timedelta object.
     """
 
-    try:
-        obj = seconds if seconds is not None else timedelta.total_seconds()
-    except AttributeError:
-        raise ValueError("You must provide either a timedelta or a number of seconds")
-
-    seconds = int(obj)
-    periods = [
-        ("year", "years", 60 * 60 * 24 * 365),
-        ("month", "months", 60 * 60 * 24 * 30),
-        ("day", "days", 60 * 60 * 24),
-        ("hour", "hours", 60 * 60),
-        ("minute", "minutes", 60),
-        ("second", "seconds", 1),
-    ]
+    if seconds is None:
+        if timedelta is None:
+            raise ValueError("You must provide either a timedelta or a number of seconds")
+        seconds = timedelta.total_seconds()
 
+    seconds = int(seconds)
     strings = []
-    for period_name, plural_period_name, period_seconds in periods:
+    for period_name, plural_period_name, period_seconds in _periods:
         if seconds >= period_seconds:
             period_value, seconds = divmod(seconds, period_seconds)
             if period_value == 0:
@@ -119,155 +149,140 @@ def humanize_timedelta(
     return human_join(strings, final="and")
 
 
-MONTHNAMES = {
-    "01": "January",
-    "02": "February",
-    "03": "March",
-    "04": "April",
-    "05": "May",
-    "06": "Jun",
-    "07": "July",
-    "08": "August",
-    "09": "September",
-    "10": "October",
-    "11": "November",
-    "12": "December",
-}
-
-DAYNAMES = {
-    "0": "Sunday",
-    "1": "Monday",
-    "2": "Tuesday",
-    "3": "Wednesday",
-    "4": "Thursday",
-    "5": "Friday",
-    "6": "Saturday",
-}
+# indexed by `datetime.month`, the first item is only a placeholder since months start from 1
+MONTHNAMES = (
+    "",
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+# indexed by `%w` weekday number, i.e. Sunday is 0
+DAYNAMES = (
+    "Sunday",
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+)
 
 # Abbreviated, takes only 3 initial letters
-MONTHS_ABBRV = {k: v[:3] for k, v in MONTHNAMES.items()}
-DAYS_ABBRV = {k: v[:3] for k, v in DAYNAMES.items()}
+MONTHS_ABBRV = tuple(v[:3] for v in MONTHNAMES)
+DAYS_ABBRV = tuple(v[:3] for v in DAYNAMES)
 
 
 TimestampStyle = Literal["f", "F", "d", "D", "t", "T", "R"]
 
 
-# noinspection PyPep8Naming
-class datetime_formatter:
+def time_string(date_time: datetime, tzinfo: timezone = timezone.utc) -> str:
     """
-    Datetime formatter. A class to convert and format datetime object.
+    Converts the datetime object to formatted string with UTC timezone.
+
+    Parameters
+    ----------
+    date_time : datetime
+        A datetime object. Doesn't have to be from the past. This parameter is required.
+    tzinfo : timezone
+        Timezone info. If not provided, defaults to UTC.
+
+    Returns
+    -------
+    str : str
+        A string of formatted value, e.g. `Sun, 02 Sep 2020 12:56 PM UTC`.
+    """
+    convert = date_time if date_time.tzinfo is tzinfo else date_time.replace(tzinfo=tzinfo)
+    month = MONTHS_ABBRV[convert.month]
+    day_abbrv = DAYS_ABBRV[convert.isoweekday() % 7]
+    # only the time part needs strftime, for the locale's AM/PM and the timezone name
+    fmt = f"{day_abbrv}, {convert.day:02d} {month} {convert.year}\n{convert.strftime('%I:%M %p %Z')}"
+    return fmt
+
+
+def age(date_time: datetime, *, source: datetime = None) -> str:
     """
+    Converts the datetime to an age.
 
-    @staticmethod
-    def time_string(date_time: datetime, tzinfo: timezone = timezone.utc) -> str:
-        """
-        Converts the datetime object to formatted string with UTC timezone.
-
-        Parameters
-        ----------
-        date_time : datetime
-            A datetime object. Doesn't have to be from the past. This parameter is required.
-        tzinfo : timezone
-            Timezone info. If not provided, defaults to UTC.
-
-        Returns
-        -------
-        str : str
-            A string of formatted value, e.g. `Sun, 02 Sep 2020 12:56 PM UTC`.
-        """
-        convert = date_time.replace(tzinfo=tzinfo)
-        year = convert.strftime("%Y")
-        month = MONTHS_ABBRV.get(convert.strftime("%m"))
-        day = convert.strftime("%d")  # use "%-d" to get without zero-padded number
-        day_abbrv = DAYS_ABBRV.get(convert.strftime("%w"))
-        hour = convert.strftime("%I")
-        minute = convert.strftime("%M")
-        am_pm = convert.strftime("%p")
-        tz_name = convert.strftime("%Z")
-
-        fmt = f"{day_abbrv}, {day} {month} {year}\n{hour}:{minute} {am_pm} {tz_name}"
-        return fmt
-
-    @staticmethod
-    def age(date_time: datetime) -> str:
-        """
-        Converts the datetime to an age.
-
-        Parameters
-        ----------
-        date_time : datetime
-            A datetime object. Doesn't have to be from the past. This parameter is required.
-            Note, the `date_time` provided here will be compared with `datetime.utcnow()`
-
-        Returns
-        -------
-        str : str
-            A string of formatted age or an empty string if there's no output,
-            e.g. `1 year 6 months`.
-        """
-        if date_time.tzinfo is None:
-            date_time = date_time.replace(tzinfo=timezone.utc)
+    Parameters
+    ----------
+    date_time : datetime
+        A datetime object. Doesn't have to be from the past. This parameter is required.
+        Note, the `date_time` provided here will be compared with `source`.
+    source : datetime
+        The datetime to compare with. If not provided, defaults to current UTC time.
+        Pass the same value when formatting multiple datetimes to compare them against
+        the same point in time.
+
+    Returns
+    -------
+    str : str
+        A string of formatted age or an empty string if there's no output,
+        e.g. `1 year 6 months`.
+    """
+    if date_time.tzinfo is None:
+        date_time = date_time.replace(tzinfo=timezone.utc)
 
+    if source is not None:
+        if source.tzinfo is None:
+            source = source.replace(tzinfo=timezone.utc)
+        now = source
+    else:
         now = datetime.now(timezone.utc)
 
-        # use `abs` in case the seconds is negative if the
-        # `date_time` passed in is a future datetime
-        delta = int(abs(now - date_time).total_seconds())
-
-        months, remainder = divmod(delta, 2628000)
-        hours, seconds = divmod(remainder, 3600)
-        minutes, seconds = divmod(seconds, 60)
-        days, hours = divmod(hours, 24)
-        years, months = divmod(months, 12)
-
-        attrs = ["years", "months", "days", "hours", "minutes", "seconds"]
-        parsed = {
-            "years": years,
-            "months": months,
-            "days": days,
-            "hours": hours,
-            "minutes": minutes,
-            "seconds": seconds,
-        }
-
-        for attr in attrs:
-            value = parsed.get(attr)
-            if value:
-                value = f"{value} {attr if value != 1 else attr[:-1]}"
-                parsed[attr] = value
-
-        if years:
-            output = [parsed.get(attr) for attr in attrs[0:3]]
-        elif months:
-            output = [parsed.get(attr) for attr in attrs[1:3]]
-        elif days:
-            output = [parsed.get(attr) for attr in attrs[2:4]]
-        elif hours:
-            output = [parsed.get(attr) for attr in attrs[3:5]]
-        elif minutes:
-            output = [parsed.get(attr) for attr in attrs[4:]]
-        else:
-            output = [parsed.get(attrs[-1])]
-        output = [v for v in output if v]
-        return " ".join(v for v in output if v)  # this could return an empty string
-
-    @staticmethod
-    def time_age(date_time: datetime) -> str:
-        """
-        Formats the datetime to time and age combined together from `format_time` and `format_age`.
-
-        Parameters
-        ----------
-        date_time : datetime
-            A datetime object. Doesn't have to be from the past. This parameter is required
-            to intantiate the class.
-
-        Returns
-        -------
-        str : str
-            The formatted string.
-        """
-        fmt = discord.utils.format_dt(date_time, "F")
-        fmt_age = datetime_formatter.age(date_time)
-        fmt += f"\n{fmt_age if fmt_age else '.....'} ago"
-        return fmt
+    # use `abs` in case the seconds is negative if the
+    # `date_time` passed in is a future datetime
+    delta = int(abs(now - date_time).total_seconds())
+
+    months, remainder = divmod(delta, 2628000)
+    hours, seconds = divmod(remainder, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    days, hours = divmod(hours, 24)
+    years, months = divmod(months, 12)
+
+    values = (years, months, days, hours, minutes, seconds)
+    # the output starts from the most significant non-zero value
+    start, stop = _age_ranges[next((i for i, value in enumerate(values) if value), 5)]
+    # this could return an empty string
+    return " ".join(
+        f"{value} {_periods[i][value != 1]}" for i, value in enumerate(values[start:stop], start) if value
+    )
+
+
+def time_age(date_time: datetime) -> str:
+    """
+    Formats the datetime to time and age combined together from `format_time` and `format_age`.
+
+    Parameters
+    ----------
+    date_time : datetime
+        A datetime object. Doesn't have to be from the past. This parameter is required.
+
+    Returns
+    -------
+    str : str
+        The formatted string.
+    """
+    return f"{discord.utils.format_dt(date_time, 'F')}\n{age(date_time) or '.....'} ago"
+
+
+# noinspection PyPep8Naming
+class datetime_formatter:
+    """
+    Datetime formatter. A namespace of the functions to convert and format datetime object.
+
+    This is kept for backward compatibility, the functions are also available at module level.
+    """
+
+    time_string = staticmethod(time_string)
+    age = staticmethod(age)
+    time_age = staticmethod(time_age)
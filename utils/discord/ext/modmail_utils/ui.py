@@ -192,9 +192,10 @@ class View(ui.View):
         await self.message.edit(view=view, **kwargs)
 
     def _stop_modals(self) -> None:
+        # `stop` is idempotent
         for modal in self.modals:
-            if modal.is_dispatching() or not modal.is_finished():
-                modal.stop()
+            modal.stop()
+        self.modals.clear()
 
     def stop(self) -> None:
         """